@@ -22,17 +22,30 @@ Usage:
 """
 
 import argparse
+import asyncio
+import hashlib
 import json
 import random
 import re
 import sys
 import time
 from datetime import datetime, timezone
+from html import unescape
 from urllib.parse import urlparse, urljoin, parse_qs, urlencode
 import os
+from pathlib import Path
 
 from curl_cffi import requests
-from lxml import html
+from lxml import etree, html
+
+# orjson est optionnel et ignore sous PyPy (pas de wheel, et le module json
+# de PyPy est deja compile par le JIT).
+orjson = None
+if sys.implementation.name != "pypy":
+    try:
+        import orjson
+    except ImportError:  # fallback sur le module json standard
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -47,6 +60,9 @@ _RED = "\033[31m"
 _CYAN = "\033[36m"
 _RESET = "\033[0m"
 
+# Active les dumps JSON detailles (--verbose)
+VERBOSE = False
+
 
 def _ts() -> str:
     return datetime.now().strftime("%H:%M:%S")
@@ -74,7 +90,10 @@ def log_err(msg: str):
 
 
 def log_json(label: str, obj, indent: int = 2, max_str: int = 200):
-    """Pretty-print a dict/list as JSON under a label."""
+    """Pretty-print a dict/list as JSON under a label (only with --verbose)."""
+    if not VERBOSE:
+        return
+
     def _truncate(o):
         if isinstance(o, str) and len(o) > max_str:
             return o[:max_str] + f"... ({len(o)} chars)"
@@ -83,8 +102,8 @@ def log_json(label: str, obj, indent: int = 2, max_str: int = 200):
         if isinstance(o, list):
             return [_truncate(v) for v in o]
         return o
-    print(f"  {_DIM}--- {label} ---{_RESET}")
-    print(json.dumps(_truncate(obj), indent=indent, ensure_ascii=False, default=str))
+    dumped = json_dumpb(_truncate(obj), indent=indent).decode("utf-8")
+    sys.stdout.write(f"  {_DIM}--- {label} ---{_RESET}\n{dumped}\n")
 
 
 def log_separator():
@@ -105,6 +124,17 @@ DEFAULT_URL = (
 # d'un vrai navigateur.
 IMPERSONATE = "chrome"
 
+# Nombre max de pages de detail chargees en parallele sur la session async.
+DETAIL_CONCURRENCY = 8
+
+# Cache disque des reponses : un rerun dans la fenetre TTL ne touche pas
+# Indeed. Au-dela, la reponse est revalidee (If-None-Match / If-Modified-Since).
+# Le Cache-Control renvoye par Indeed peut raccourcir ces durees (voir
+# cache_lookup). Le listing (tri par date) expire vite, les details non.
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+CACHE_TTL = 24 * 3600
+LISTING_CACHE_TTL = 15 * 60
+
 # Headers coherents avec un vrai navigateur Firefox sur macOS.
 # Indeed verifie notamment les Sec-Fetch-* headers.
 LISTING_HEADERS = {
@@ -135,41 +165,66 @@ DETAIL_HEADERS = {
     "Accept-Language": "fr,fr-FR;q=0.9,en-US;q=0.8,en;q=0.7",
 }
 
+# Parsers HTML partages. huge_tree leve la limite de libxml2 sur les noeuds
+# texte geants (le <script> mosaic-data fait plusieurs Mo sur une ligne),
+# recover tolere le HTML mal forme, et collect_ids=False evite l'index des id
+# (les recherches passent par XPath). Les reponses brutes (bytes) sont
+# decodees par lxml lui-meme, sans str Python intermediaire.
+_HTML_PARSER_OPTIONS = dict(huge_tree=True, recover=True, collect_ids=False)
+_HTML_PARSER = html.HTMLParser(**_HTML_PARSER_OPTIONS)
+_HTML_BYTES_PARSER = html.HTMLParser(encoding="utf-8", **_HTML_PARSER_OPTIONS)
+
+# Taille des blocs envoyes au parser incremental (recherche des <script>)
+_SCAN_CHUNK_SIZE = 64 * 1024
+
+# XPath compilees une seule fois au chargement du module : lxml n'a plus a
+# re-parser l'expression a chaque page. smart_strings=False renvoie des str
+# simples (pas de lien vers le noeud parent), acceptees telles quelles par orjson.
+_XP_LEGACY = etree.XPath(
+    '//script[@id="comp-initialData" and @type="application/json"]/text()',
+    smart_strings=False,
+)
+_XP_MOSAIC = etree.XPath('//script[@id="mosaic-data"]/text()', smart_strings=False)
+_XP_MOSAIC_INIT = etree.XPath(
+    '//script[@id="mosaic-init-data"]/text()', smart_strings=False
+)
+_XP_JSONLD = etree.XPath(
+    '//script[@type="application/ld+json"]/text()', smart_strings=False
+)
+
+# Regex compilees une seule fois
+_MOSAIC_PROVIDER_RE = re.compile(
+    r"window\.mosaic\.providerData\[(?:\"|')(?P<key>.+?)(?:\"|')\]"
+    r"\s*=\s*\{",
+    re.S,
+)
+# Balise ouvrante/fermante : "<" suivi d'une lettre ou de "/", attributs
+# entre guillemets autorises (ils peuvent contenir ">")
+_HTML_TAG_RE = re.compile(r"""<[A-Za-z/](?:[^>"']|"[^"]*"|'[^']*')*>""")
+
 
 # ---------------------------------------------------------------------------
 # JSON extraction utilities
 # ---------------------------------------------------------------------------
 
-def extract_json_object(text: str, start_idx: int) -> str | None:
-    """
-    Extrait un objet JSON d'une string par comptage d'accolades.
-    Gere correctement les strings JSON (guillemets, echappement).
-    """
-    if start_idx < 0 or start_idx >= len(text) or text[start_idx] != "{":
-        return None
-    depth = 0
-    in_str = False
-    esc = False
-    for i in range(start_idx, len(text)):
-        ch = text[i]
-        if in_str:
-            if esc:
-                esc = False
-            elif ch == "\\":
-                esc = True
-            elif ch == '"':
-                in_str = False
-            continue
-        if ch == '"':
-            in_str = True
-            continue
-        if ch == "{":
-            depth += 1
-        elif ch == "}":
-            depth -= 1
-            if depth == 0:
-                return text[start_idx : i + 1]
-    return None
+# Decodeur JSON partage : raw_decode() parse un objet en place dans une
+# string plus longue et retourne l'index de fin, le tout en C.
+# orjson n'a pas d'equivalent, les providers Mosaic restent donc sur json.
+_DECODER = json.JSONDecoder()
+
+# Decodage des documents JSON complets : orjson si installe (2-5x plus rapide).
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumpb(obj, indent: int = 2) -> bytes:
+    """Serialise en JSON UTF-8 indente (orjson si disponible)."""
+    if orjson is not None and indent == 2:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str,
+        )
+    return json.dumps(obj, indent=indent, ensure_ascii=False, default=str).encode("utf-8")
 
 
 def extract_mosaic_providers(script_text: str) -> dict[str, dict]:
@@ -178,32 +233,31 @@ def extract_mosaic_providers(script_text: str) -> dict[str, dict]:
     Les donnees sont exposees via des assignations JS :
         window.mosaic.providerData["mosaic-provider-jobcards"] = {...};
 
-    On extrait chaque provider par regex + comptage d'accolades.
+    On localise chaque provider par regex puis on decode l'objet en place
+    avec JSONDecoder.raw_decode.
     """
     providers: dict[str, dict] = {}
     if not script_text:
         return providers
 
-    pattern = re.compile(
-        r"window\.mosaic\.providerData\[(?:\"|')(?P<key>.+?)(?:\"|')\]"
-        r"\s*=\s*\{",
-        re.S,
-    )
-    for m in pattern.finditer(script_text):
+    for m in _MOSAIC_PROVIDER_RE.finditer(script_text):
         key = (m.group("key") or "").strip()
-        start = m.end() - 1
-        blob = extract_json_object(script_text, start)
-        if not blob:
-            continue
         try:
-            data = json.loads(blob)
-        except Exception:
+            data, _ = _DECODER.raw_decode(script_text, m.end() - 1)
+        except json.JSONDecodeError:
             continue
         if isinstance(data, dict) and key:
             providers[key] = data
     return providers
 
 
+def _parse_html(text: bytes | str):
+    """Construit le DOM ; les bytes sont decodes par lxml directement."""
+    if isinstance(text, bytes):
+        return html.fromstring(text, parser=_HTML_BYTES_PARSER)
+    return html.fromstring(text, parser=_HTML_PARSER)
+
+
 def html_to_text(raw: str | None) -> str | None:
     """Convertit du HTML en texte brut."""
     if not raw or not isinstance(raw, str):
@@ -211,6 +265,16 @@ def html_to_text(raw: str | None) -> str | None:
     raw = raw.strip()
     if not raw:
         return None
+    # Cas courant (balises simples) : regex + unescape, sans construire de DOM.
+    # lxml reste utilise pour script/style, commentaires/CDATA ("<!") et des
+    # qu'un "<" ne fait pas partie d'une balise complete.
+    # Sur du HTML mal imbrique (balise fermante orpheline, ex. "x</b>a"), ce
+    # chemin peut inserer un espace la ou lxml ignore la balise ("x a" au lieu
+    # de "xa") ; le HTML correctement imbrique donne le meme texte.
+    if "<!" not in raw and "<script" not in raw and "<style" not in raw:
+        stripped = _HTML_TAG_RE.sub(" ", raw)
+        if "<" not in stripped:
+            return " ".join(unescape(stripped).split()) or None
     try:
         node = html.fromstring(raw)
         txt = " ".join(t.strip() for t in node.itertext() if t and t.strip())
@@ -238,7 +302,53 @@ def epoch_ms_to_iso(value) -> str | None:
 # Parsing de la page de listing (SERP)
 # ---------------------------------------------------------------------------
 
-def parse_listing_page(text: str) -> tuple[list[dict], int]:
+def _iter_script_elements(content: bytes):
+    """
+    Parse le HTML par blocs et produit chaque <script> des sa fermeture.
+    HTMLPullParser plutot qu'iterparse(html=True) : ce dernier ignore
+    huge_tree et perd silencieusement les <script> de plus de 10 Mo.
+    """
+    parser = etree.HTMLPullParser(
+        events=("end",), tag="script", encoding="utf-8", **_HTML_PARSER_OPTIONS
+    )
+    for offset in range(0, len(content), _SCAN_CHUNK_SIZE):
+        parser.feed(content[offset : offset + _SCAN_CHUNK_SIZE])
+        for _, elem in parser.read_events():
+            yield elem
+    parser.close()
+    for _, elem in parser.read_events():
+        yield elem
+
+
+def _scan_listing_scripts(content: bytes) -> tuple[str | None, str | None] | None:
+    """
+    Cherche les <script> de donnees en parsant la page par blocs, et s'arrete
+    des que comp-initialData ou mosaic-data est lu : l'arbre n'est construit
+    que jusqu'a ce script (les <script> lus sont vides au passage).
+    Retourne (legacy, mosaic), (None, None) si la page n'en contient pas,
+    ou None si lxml a echoue.
+    """
+    mosaic_init = None
+    try:
+        for elem in _iter_script_elements(content):
+            sid = elem.get("id")
+            stype = elem.get("type")
+            script_text = elem.text
+            elem.clear()
+            if not script_text:
+                continue
+            if sid == "comp-initialData" and stype == "application/json":
+                return script_text, None
+            if sid == "mosaic-data":
+                return None, script_text
+            if sid == "mosaic-init-data" and mosaic_init is None:
+                mosaic_init = script_text
+    except etree.LxmlError:
+        return None
+    return None, mosaic_init
+
+
+def parse_listing_page(text: bytes | str) -> tuple[list[dict], int]:
     """
     Parse la page de resultats Indeed.
     Retourne (jobs, total_count).
@@ -246,40 +356,42 @@ def parse_listing_page(text: str) -> tuple[list[dict], int]:
     Supporte deux formats :
     - Mosaic (2026+) : window.mosaic.providerData[...]
     - Legacy : <script id="comp-initialData">
+
+    `text` est de preference le corps brut (bytes) de la reponse : le
+    <script> de donnees est alors cherche par parsing incremental, arrete
+    des que le script est trouve. Le DOM complet + XPath ne sert que pour
+    une str ou si le parsing incremental echoue.
     """
-    doc = html.fromstring(text)
+    scanned = _scan_listing_scripts(text) if isinstance(text, bytes) else None
+    if scanned is not None:
+        legacy_script, mosaic_script = scanned
+    else:
+        legacy_script = mosaic_script = None
+        doc = _parse_html(text)
+        scripts = _XP_LEGACY(doc)
+        if scripts:
+            legacy_script = scripts[0]
+        else:
+            scripts = _XP_MOSAIC(doc) or _XP_MOSAIC_INIT(doc)
+            if scripts:
+                mosaic_script = scripts[0]
 
-    # 1. Essayer le format legacy
-    scripts = doc.xpath(
-        '//script[@id="comp-initialData" and @type="application/json"]/text()'
-    )
-    if scripts:
+    # 1. Format legacy
+    if legacy_script is not None:
         log_ok("Format detecte: Legacy (comp-initialData)")
-        data = json.loads(scripts[0])
+        data = _json_loads(legacy_script)
         jobs = data.get("jobList", {}).get("jobs", [])
         total = data.get("jobList", {}).get("filteredJobCount", len(jobs))
         return jobs, int(total)
 
     # 2. Format Mosaic (2026+)
-    mosaic_scripts = doc.xpath('//script[@id="mosaic-data"]/text()')
-    if not mosaic_scripts:
-        mosaic_scripts = doc.xpath('//script[@id="mosaic-init-data"]/text()')
-
-    # Fallback regex si lxml echoue sur des lignes tres longues
-    if not mosaic_scripts:
-        match = re.search(
-            r'<script[^>]*id="mosaic-data"[^>]*>(.*?)</script>', text, re.DOTALL
-        )
-        if match:
-            mosaic_scripts = [match.group(1).strip()]
-
-    if not mosaic_scripts:
+    if not mosaic_script:
         log_err("Impossible de trouver les donnees Indeed dans la page.")
         log_err("Le site a peut-etre change de structure, ou vous etes bloque.")
         return [], 0
 
     log_ok("Format detecte: Mosaic (2026+)")
-    providers = extract_mosaic_providers(mosaic_scripts[0])
+    providers = extract_mosaic_providers(mosaic_script)
     log_info(f"Providers trouves: {', '.join(providers.keys()) or 'aucun'}")
 
     # Extraire les offres depuis mosaic-provider-jobcards
@@ -307,25 +419,27 @@ def parse_listing_page(text: str) -> tuple[list[dict], int]:
 
 def extract_job_from_listing(job: dict) -> dict:
     """Extrait les champs utiles d'une offre dans le listing."""
+    g = job.get  # methode liee une seule fois, reutilisee pour chaque champ
+
     job_key = (
-        job.get("jobKey")
-        or job.get("jobkey")
-        or (job.get("mouseDownHandlerOption") or {}).get("jobKey")
+        g("jobKey")
+        or g("jobkey")
+        or (g("mouseDownHandlerOption") or {}).get("jobKey")
     )
 
     published = (
-        epoch_ms_to_iso(job.get("pubDate"))
-        or epoch_ms_to_iso(job.get("createDate"))
-        or job.get("formattedRelativeTime")
+        epoch_ms_to_iso(g("pubDate"))
+        or epoch_ms_to_iso(g("createDate"))
+        or g("formattedRelativeTime")
     )
 
-    salary_snippet = job.get("salarySnippet") or {}
+    salary_snippet = g("salarySnippet") or {}
 
     return {
         "job_key": job_key,
-        "title": job.get("title"),
-        "company": job.get("company"),
-        "location": job.get("formattedLocation") or job.get("jobLocationCity"),
+        "title": g("title"),
+        "company": g("company"),
+        "location": g("formattedLocation") or g("jobLocationCity"),
         "salary": salary_snippet.get("text") if isinstance(salary_snippet, dict) else None,
         "published_at": published,
         "url": f"https://fr.indeed.com/viewjob?jk={job_key}" if job_key else None,
@@ -336,20 +450,39 @@ def extract_job_from_listing(job: dict) -> dict:
 # Parsing de la page de detail (offre)
 # ---------------------------------------------------------------------------
 
-def dict_get(d: dict, path: str, default=None):
-    """Acces par chemin slash-separe : dict_get(d, 'a/b/c') == d['a']['b']['c']"""
-    keys = path.split("/")
+# Chemins precalcules dans le JSON embedded (tuples de cles, index int pour
+# les listes) : pas de split a chaque lookup.
+_P_JOB_INFO = ("body", "jobInfoWrapperModel", "jobInfoModel")
+_P_DETAILS = _P_JOB_INFO + ("jobDescriptionSectionModel", "jobDetailsSection")
+_P_HOST_JOB = ("body", "hostQueryExecutionResult", "data", "jobData", "results", 0, "job")
+
+_P_COMPANY = _P_JOB_INFO + ("jobInfoHeaderModel", "companyName")
+_P_SOURCE_EMPLOYER = _P_HOST_JOB + ("sourceEmployerName",)
+_P_LOCATION = ("body", "jobLocation")
+_P_CONTENTS = _P_DETAILS + ("contents",)
+_P_SALARY_INFO = _P_DETAILS + ("salaryInfoModel",)
+_P_CONTRACT_TYPE = _P_CONTENTS + ("Type de contrat",)
+_P_JOB_TYPES = _P_DETAILS + ("jobTypes",)
+_P_DESCRIPTION = _P_JOB_INFO + ("sanitizedJobDescription",)
+_P_DESCRIPTION_CONTENT = _P_DESCRIPTION + ("content",)
+
+
+def dict_get(d: dict, path: tuple, default=None):
+    """Acces par chemin : dict_get(d, ('a', 0, 'c')) == d['a'][0]['c']"""
     current = d
-    for key in keys:
-        if not isinstance(current, dict):
+    for key in path:
+        if isinstance(current, dict):
+            current = current.get(key)
+        elif isinstance(current, list) and isinstance(key, int):
+            current = current[key] if -len(current) <= key < len(current) else None
+        else:
             return default
-        current = current.get(key)
         if current is None:
             return default
     return current
 
 
-def parse_detail_page(text: str) -> dict:
+def parse_detail_page(text: bytes | str) -> dict:
     """
     Parse la page de detail d'une offre Indeed.
     Le format embedded (viewtype=embedded) retourne du JSON directement.
@@ -357,20 +490,20 @@ def parse_detail_page(text: str) -> dict:
     """
     # 1. Essayer de parser comme JSON pur (cas le plus courant avec embedded)
     try:
-        data = json.loads(text)
+        data = _json_loads(text)
         if isinstance(data, dict):
             return extract_fields_from_json(data)
     except Exception:
         pass
 
     # 2. Fallback HTML : chercher JSON-LD JobPosting
-    doc = html.fromstring(text)
-    for raw in doc.xpath('//script[@type="application/ld+json"]/text()'):
+    doc = _parse_html(text)
+    for raw in _XP_JSONLD(doc):
         raw = (raw or "").strip()
         if not raw:
             continue
         try:
-            ld = json.loads(raw)
+            ld = _json_loads(raw)
         except Exception:
             continue
 
@@ -397,16 +530,16 @@ def extract_fields_from_json(data: dict) -> dict:
 
     # Company : plusieurs chemins possibles
     company = (
-        dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/jobInfoHeaderModel/companyName")
-        or dict_get(data, "body/hostQueryExecutionResult/data/jobData/results/0/job/sourceEmployerName")
+        dict_get(data, _P_COMPANY)
+        or dict_get(data, _P_SOURCE_EMPLOYER)
     )
 
     # Location
-    location = dict_get(data, "body/jobLocation")
+    location = dict_get(data, _P_LOCATION)
 
     # Salary : essayer plusieurs sources
     salary = None
-    contents = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/jobDescriptionSectionModel/jobDetailsSection/contents") or {}
+    contents = dict_get(data, _P_CONTENTS) or {}
     if isinstance(contents, dict):
         for key in ("Salaire", "Remuneration", "Pay", "Salary"):
             vals = contents.get(key)
@@ -415,17 +548,17 @@ def extract_fields_from_json(data: dict) -> dict:
                 break
 
     if not salary:
-        salary_info = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/jobDescriptionSectionModel/jobDetailsSection/salaryInfoModel")
+        salary_info = dict_get(data, _P_SALARY_INFO)
         if isinstance(salary_info, dict):
             salary = salary_info.get("salaryText") or salary_info.get("formattedSalary")
 
     # Contract type
     contract_type = None
-    ct_vals = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/jobDescriptionSectionModel/jobDetailsSection/contents/Type de contrat")
+    ct_vals = dict_get(data, _P_CONTRACT_TYPE)
     if isinstance(ct_vals, list) and ct_vals:
         contract_type = ", ".join(ct_vals)
     else:
-        job_types = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/jobDescriptionSectionModel/jobDetailsSection/jobTypes") or []
+        job_types = dict_get(data, _P_JOB_TYPES) or []
         if isinstance(job_types, list):
             labels = [jt.get("label") for jt in job_types if isinstance(jt, dict) and jt.get("label")]
             if labels:
@@ -433,17 +566,17 @@ def extract_fields_from_json(data: dict) -> dict:
 
     # Description
     description = None
-    raw_desc = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/sanitizedJobDescription/content")
+    raw_desc = dict_get(data, _P_DESCRIPTION_CONTENT)
     if raw_desc:
         description = html_to_text(raw_desc)
     if not description:
-        raw_desc2 = dict_get(data, "body/jobInfoWrapperModel/jobInfoModel/sanitizedJobDescription")
+        raw_desc2 = dict_get(data, _P_DESCRIPTION)
         if isinstance(raw_desc2, str):
             description = html_to_text(raw_desc2)
 
     # Published at
     published_at = None
-    host_job = dict_get(data, "body/hostQueryExecutionResult/data/jobData/results/0/job") or {}
+    host_job = dict_get(data, _P_HOST_JOB) or {}
     if isinstance(host_job, dict):
         published_at = (
             epoch_ms_to_iso(host_job.get("datePublished"))
@@ -510,6 +643,129 @@ def extract_fields_from_jsonld(jp: dict) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Cache disque
+# ---------------------------------------------------------------------------
+
+def cache_key(url: str) -> str:
+    """Cle courte et stable derivee d'une URL."""
+    return hashlib.blake2b(url.encode()).hexdigest()[:16]
+
+
+# Champs du sidecar .meta.json -> header HTTP correspondant
+_META_HEADERS = {
+    "etag": "ETag",
+    "last_modified": "Last-Modified",
+    "cache_control": "Cache-Control",
+}
+
+
+def _meta_path(path: Path) -> Path:
+    return path.with_name(path.name + ".meta.json")
+
+
+def parse_cache_control(value: str | None) -> dict[str, str | None]:
+    """'no-cache, max-age=60' -> {'no-cache': None, 'max-age': '60'}"""
+    directives: dict[str, str | None] = {}
+    for part in (value or "").split(","):
+        name, _, arg = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = arg.strip().strip('"') or None
+    return directives
+
+
+def _effective_ttl(cache_control: str | None, ttl: int) -> int:
+    """
+    Duree de fraicheur d'une entree, bornee par le Cache-Control stocke :
+    - pas de header : `ttl` (politique locale) ;
+    - no-cache : 0, toujours revalider ;
+    - max-age=N : min(N, ttl) ;
+    - autre chose sans max-age (ex. private seul) : 0, toujours revalider.
+    """
+    if cache_control is None:
+        return ttl
+    directives = parse_cache_control(cache_control)
+    if "no-cache" in directives:
+        return 0
+    try:
+        return min(int(directives["max-age"]), ttl)
+    except (KeyError, TypeError, ValueError):
+        return 0
+
+
+def _read_meta(path: Path) -> dict:
+    try:
+        return json.loads(_meta_path(path).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def cache_lookup(path: Path | None, ttl: int = CACHE_TTL) -> tuple[bytes | None, dict]:
+    """
+    Retourne (contenu, headers conditionnels).
+    Le contenu n'est renvoye que si l'entree est encore fraiche (`ttl`, borne
+    par le Cache-Control de la reponse d'origine) ; sinon les validateurs
+    stockes (ETag, Last-Modified) sont renvoyes pour une requete conditionnelle.
+    """
+    if path is None:
+        return None, {}
+    try:
+        age = time.time() - path.stat().st_mtime
+    except OSError:
+        return None, {}
+    meta = _read_meta(path)
+    if age < _effective_ttl(meta.get("cache_control"), ttl):
+        try:
+            return path.read_bytes(), {}
+        except OSError:
+            return None, {}
+    validators = {}
+    if meta.get("etag"):
+        validators["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        validators["If-Modified-Since"] = meta["last_modified"]
+    return None, validators
+
+
+def cache_revalidated(path: Path, response=None) -> bytes:
+    """
+    Reponse 304 : l'entree est toujours valide, on repart pour un TTL.
+    Les headers de cache eventuellement renvoyes avec le 304 remplacent
+    ceux stockes.
+    """
+    if response is not None:
+        meta = _read_meta(path)
+        for key, header in _META_HEADERS.items():
+            if response.headers.get(header) is not None:
+                meta[key] = response.headers.get(header)
+        try:
+            _meta_path(path).write_text(json.dumps(meta), encoding="utf-8")
+        except OSError:
+            pass
+    path.touch()
+    return path.read_bytes()
+
+
+def cache_store(path: Path | None, response) -> None:
+    """
+    Ecrit le corps de la reponse et ses headers de cache (sidecar .meta.json).
+    Rien n'est ecrit si la reponse est marquee Cache-Control: no-store.
+    """
+    if path is None:
+        return
+    if "no-store" in parse_cache_control(response.headers.get("Cache-Control")):
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(response.content)
+        meta = {"url": str(response.url)}
+        for key, header in _META_HEADERS.items():
+            meta[key] = response.headers.get(header)
+        _meta_path(path).write_text(json.dumps(meta), encoding="utf-8")
+    except OSError as e:
+        log_warn(f"Ecriture du cache impossible ({path}): {e}")
+
+
 # ---------------------------------------------------------------------------
 # Scraper principal
 # ---------------------------------------------------------------------------
@@ -524,6 +780,9 @@ def create_session(proxy_url: str | None = None) -> requests.Session:
     log_info(f"TLS impersonation: {IMPERSONATE}")
 
     session = requests.Session(impersonate=IMPERSONATE)
+    # Headers fixes poses une fois sur la session ; chaque requete n'ajoute
+    # que son Referer. La session (et ses connexions keep-alive) est reutilisee.
+    session.headers.update(LISTING_HEADERS)
 
     if proxy_url:
         session.proxies = {"http": proxy_url, "https": proxy_url}
@@ -536,7 +795,31 @@ def create_session(proxy_url: str | None = None) -> requests.Session:
     return session
 
 
-def scrape_listing(session: requests.Session, url: str) -> tuple[list[dict], int]:
+def create_async_session(
+    proxy_url: str | None = None,
+    max_clients: int = DETAIL_CONCURRENCY,
+    cookies=None,
+) -> requests.AsyncSession:
+    """
+    Cree la session async utilisee pour les pages de detail.
+    C'est une session distincte de celle du listing (pas de connexion
+    partagee avec elle) : on lui passe donc les cookies poses par la SERP,
+    sans quoi les details risquent d'etre bloques. Elle est partagee par
+    toutes les taches de detail, avec un pool dimensionne sur la concurrence.
+    """
+    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
+    return requests.AsyncSession(
+        impersonate=IMPERSONATE,
+        proxies=proxies,
+        headers=DETAIL_HEADERS,
+        cookies=cookies,
+        max_clients=max_clients,
+    )
+
+
+def scrape_listing(
+    session: requests.Session, url: str, cache_dir: Path | None = None
+) -> tuple[list[dict], int]:
     """
     Charge la page de resultats et parse les offres.
     Retourne (jobs, total_count).
@@ -544,28 +827,44 @@ def scrape_listing(session: requests.Session, url: str) -> tuple[list[dict], int
     log_step("Chargement de la page de resultats (SERP)")
     log_info(f"URL: {url}")
 
-    headers = dict(LISTING_HEADERS)
-    parsed = urlparse(url)
-    headers["Referer"] = f"{parsed.scheme}://{parsed.netloc}/jobs"
+    cache_path = cache_dir / f"listing-{cache_key(url)}.html" if cache_dir else None
+    content, validators = cache_lookup(cache_path, ttl=LISTING_CACHE_TTL)
+    fresh_response = None
 
-    response = session.get(url, headers=headers, timeout=30)
-    log_info(f"HTTP {response.status_code} -- {len(response.text):,} bytes")
-
-    if response.status_code != 200:
-        log_err(f"Status inattendu: {response.status_code}")
-        if "secure.indeed.com/auth" in str(response.url):
-            log_err("Bot detecte: redirection vers secure.indeed.com/auth")
-            log_err("Essayez avec un proxy different (PROXY_URL=...)")
-        return [], 0
+    if content is not None:
+        log_ok(f"Page servie depuis le cache ({cache_path.name})")
+    else:
+        parsed = urlparse(url)
+        headers = {"Referer": f"{parsed.scheme}://{parsed.netloc}/jobs", **validators}
+
+        response = session.get(url, headers=headers, timeout=30)
+        log_info(f"HTTP {response.status_code} -- {len(response.content):,} bytes")
+
+        if response.status_code == 304 and cache_path:
+            log_ok("Page inchangee (304), lecture du cache")
+            content = cache_revalidated(cache_path, response)
+        elif response.status_code != 200:
+            log_err(f"Status inattendu: {response.status_code}")
+            if "secure.indeed.com/auth" in str(response.url):
+                log_err("Bot detecte: redirection vers secure.indeed.com/auth")
+                log_err("Essayez avec un proxy different (PROXY_URL=...)")
+            return [], 0
+        else:
+            content = response.content
+            fresh_response = response
 
     log_ok("Page recue, parsing en cours...")
-    jobs_raw, total = parse_listing_page(response.text)
+    jobs_raw, total = parse_listing_page(content)
+
+    # Ne cacher que les pages exploitables (pas un challenge Cloudflare en 200)
+    if fresh_response is not None and jobs_raw:
+        cache_store(cache_path, fresh_response)
     jobs = [extract_job_from_listing(j) for j in jobs_raw]
 
     log_ok(f"{len(jobs)} offres extraites sur cette page (total Indeed: {total})")
 
     # Afficher le JSON extrait de chaque offre du listing
-    if jobs:
+    if jobs and VERBOSE:
         log_step(f"JSON extrait du listing ({len(jobs)} offres)")
         for i, job in enumerate(jobs, 1):
             log_separator()
@@ -574,15 +873,23 @@ def scrape_listing(session: requests.Session, url: str) -> tuple[list[dict], int
     return jobs, total
 
 
-def scrape_job_detail(session: requests.Session, job: dict, index: int = 0, total: int = 0) -> dict:
+async def scrape_job_detail(
+    session: requests.AsyncSession,
+    job: dict,
+    index: int = 0,
+    total: int = 0,
+    cache_dir: Path | None = None,
+) -> tuple[dict, bool]:
     """
     Charge la page de detail d'une offre via l'URL embedded.
     Indeed retourne du JSON pur avec viewtype=embedded.
+    Retourne (job, fetched) : fetched est False si aucune requete n'a ete
+    envoyee (pas de job_key, ou page servie depuis le cache).
     """
     jk = job.get("job_key")
     if not jk:
         log_warn(f"Pas de job_key pour: {job.get('title', '?')}")
-        return job
+        return job, False
 
     progress = f"[{index}/{total}]" if total else ""
     log_info(f"{progress} Detail de: {job.get('title', '?')} (jk={jk})")
@@ -592,16 +899,32 @@ def scrape_job_detail(session: requests.Session, job: dict, index: int = 0, tota
         f"&jk={jk}&from=shareddesktop_copy&adid=0&spa=1&hidecmpheader=1"
     )
 
-    headers = dict(DETAIL_HEADERS)
-    headers["Referer"] = job.get("url", "https://fr.indeed.com/jobs")
+    cache_path = cache_dir / f"{jk}.json" if cache_dir else None
+    content, validators = cache_lookup(cache_path)
+    fresh_response = None
+    fetched = content is None
 
-    response = session.get(detail_url, headers=headers, timeout=30)
+    if fetched:
+        headers = {"Referer": job.get("url", "https://fr.indeed.com/jobs"), **validators}
 
-    if response.status_code != 200:
-        log_warn(f"HTTP {response.status_code} pour jk={jk}")
-        return job
+        response = await session.get(detail_url, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cache_path:
+            content = cache_revalidated(cache_path, response)
+        elif response.status_code != 200:
+            log_warn(f"HTTP {response.status_code} pour jk={jk}")
+            return job, True
+        else:
+            content = response.content
+            fresh_response = response
+    else:
+        log_info(f"jk={jk} servi depuis le cache")
+
+    detail = parse_detail_page(content)
 
-    detail = parse_detail_page(response.text)
+    # Ne cacher que les pages dont on a pu extraire au moins un champ
+    if fresh_response is not None and any(v is not None for v in detail.values()):
+        cache_store(cache_path, fresh_response)
 
     # Fusionner : le detail enrichit les donnees du listing
     new_fields = []
@@ -612,7 +935,63 @@ def scrape_job_detail(session: requests.Session, job: dict, index: int = 0, tota
 
     log_ok(f"Champs enrichis: {', '.join(new_fields) if new_fields else 'aucun nouveau'}")
 
-    return job
+    return job, fetched
+
+
+async def _bounded_fetch(
+    sem: asyncio.Semaphore,
+    session: requests.AsyncSession,
+    job: dict,
+    index: int,
+    total: int,
+    cache_dir: Path | None = None,
+    pause: bool = True,
+) -> dict:
+    """
+    Charge un detail en respectant la limite de concurrence.
+    Une erreur reseau ne coute que cette offre : on garde les donnees du listing.
+    """
+    async with sem:
+        try:
+            job, fetched = await scrape_job_detail(
+                session, job, index=index, total=total, cache_dir=cache_dir
+            )
+        except requests.RequestsError as e:
+            log_warn(f"Echec du detail pour jk={job.get('job_key')}: {e}")
+            fetched = True
+        # Pause par slot pour ne pas marteler Indeed (inutile si rien n'a ete
+        # demande au serveur, ou si plus aucune offre n'attend ce slot)
+        if pause and fetched:
+            await asyncio.sleep(random.uniform(2, 4))
+        return job
+
+
+async def _fetch_all(
+    jobs: list[dict],
+    proxy_url: str | None,
+    concurrency: int = DETAIL_CONCURRENCY,
+    cache_dir: Path | None = None,
+    cookies=None,
+) -> list[dict]:
+    """
+    Charge les details de toutes les offres en parallele (ordre conserve).
+    `cookies` : cookies de la session du listing, repris par la session async.
+    """
+    sem = asyncio.Semaphore(concurrency)
+    total = len(jobs)
+    async with create_async_session(
+        proxy_url, max_clients=concurrency, cookies=cookies
+    ) as session:
+        # Le semaphore sert les taches dans l'ordre : les `concurrency` dernieres
+        # offres ne liberent leur slot pour personne, inutile de pauser apres.
+        tasks = [
+            _bounded_fetch(
+                sem, session, job, i, total,
+                cache_dir=cache_dir, pause=i <= total - concurrency,
+            )
+            for i, job in enumerate(jobs, 1)
+        ]
+        return await asyncio.gather(*tasks)
 
 
 def print_job_summary(job: dict, index: int):
@@ -641,17 +1020,37 @@ def main():
         "--max", type=int, default=10,
         help="Nombre max d'offres a detailler (defaut: 10)"
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=DETAIL_CONCURRENCY,
+        help=f"Pages de detail chargees en parallele (defaut: {DETAIL_CONCURRENCY})"
+    )
     parser.add_argument(
         "--no-detail", action="store_true",
         help="Ne pas charger les pages de detail (listing seulement)"
     )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+        help="Dossier du cache disque des reponses (defaut: .cache/)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Desactiver le cache disque (toujours telecharger)"
+    )
     parser.add_argument(
         "--json-output", action="store_true",
         help="Ecrire le JSON final dans un fichier jobs_output.json"
     )
+    parser.add_argument(
+        "--verbose", "-v", action="store_true",
+        help="Afficher le JSON de chaque offre (listing et resultat final)"
+    )
     args = parser.parse_args()
 
+    global VERBOSE
+    VERBOSE = args.verbose
+
     proxy_url = os.environ.get("PROXY_URL")
+    cache_dir = None if args.no_cache else args.cache_dir
 
     print(f"\n{_BOLD}{'=' * 70}")
     print(f"  Indeed Scraper -- curl_cffi + Chrome TLS Impersonation")
@@ -661,7 +1060,7 @@ def main():
     session = create_session(proxy_url)
 
     # --- Phase 2 : Listing ---
-    jobs, total = scrape_listing(session, args.url)
+    jobs, total = scrape_listing(session, args.url, cache_dir=cache_dir)
 
     if not jobs:
         log_err("Aucune offre trouvee. Verifiez l'URL ou le proxy.")
@@ -670,14 +1069,17 @@ def main():
     # --- Phase 3 : Details ---
     if not args.no_detail:
         limit = min(len(jobs), args.max)
-        log_step(f"Chargement des details ({limit} offres)")
-
-        for i in range(limit):
-            jobs[i] = scrape_job_detail(session, jobs[i], index=i + 1, total=limit)
-            if i < limit - 1:
-                delay = random.uniform(2, 4)
-                log_info(f"Pause {delay:.1f}s...")
-                time.sleep(delay)
+        log_step(f"Chargement des details ({limit} offres, {args.concurrency} en parallele)")
+
+        jobs[:limit] = asyncio.run(
+            _fetch_all(
+                jobs[:limit],
+                proxy_url,
+                max(1, args.concurrency),
+                cache_dir,
+                cookies=session.cookies,
+            )
+        )
 
     # --- Phase 4 : Resultats finaux ---
     display_jobs = jobs[: args.max]
@@ -688,16 +1090,17 @@ def main():
         print_job_summary(job, i)
 
     # JSON complet de chaque offre enrichie
-    log_step("JSON complet des offres enrichies")
-    for i, job in enumerate(display_jobs, 1):
-        log_separator()
-        log_json(f"Offre #{i} -- {job.get('title', '?')}", job)
+    if VERBOSE:
+        log_step("JSON complet des offres enrichies")
+        for i, job in enumerate(display_jobs, 1):
+            log_separator()
+            log_json(f"Offre #{i} -- {job.get('title', '?')}", job)
 
     # Export fichier optionnel
     if args.json_output:
         out_path = os.path.join(os.path.dirname(__file__) or ".", "jobs_output.json")
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(display_jobs, f, indent=2, ensure_ascii=False, default=str)
+        with open(out_path, "wb") as f:
+            f.write(json_dumpb(display_jobs))
         log_ok(f"JSON ecrit dans {out_path}")
 
     print(f"\n{_BOLD}{'=' * 70}")
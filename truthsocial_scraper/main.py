@@ -1,10 +1,16 @@
 import re
+import sys
 import textwrap
 from datetime import datetime, timezone
 from html import unescape
 
 from curl_cffi import requests
 
+try:
+    import ahocorasick
+except ImportError:  # optional: falls back to the regex alternation
+    ahocorasick = None
+
 # ---------------------------------------------------------------------------
 # ANSI colors
 # ---------------------------------------------------------------------------
@@ -35,6 +41,23 @@ FINANCIAL_KEYWORDS = [
     r"microsoft", r"tiktok", r"boeing", r"lockheed",
 ]
 _FIN_PATTERN = re.compile("|".join(FINANCIAL_KEYWORDS), re.IGNORECASE)
+# Literal part of each keyword: every match contains one of them, so a post
+# with none of these substrings cannot match and skips the full scan.
+_FIN_LITERALS = tuple(kw.removesuffix(r"\b") for kw in FINANCIAL_KEYWORDS)
+
+
+def _build_fin_automaton():
+    # Keywords are literals, optionally followed by \b: the automaton stores
+    # the literal with its position in FINANCIAL_KEYWORDS and a boundary flag.
+    automaton = ahocorasick.Automaton()
+    for order, kw in enumerate(FINANCIAL_KEYWORDS):
+        word = _FIN_LITERALS[order]
+        automaton.add_word(word, (order, word, word != kw))
+    automaton.make_automaton()
+    return automaton
+
+
+_FIN_AC = _build_fin_automaton() if ahocorasick is not None else None
 _HTML_TAG = re.compile(r"<[^>]+>")
 
 # ---------------------------------------------------------------------------
@@ -74,9 +97,12 @@ def strip_html(raw: str) -> str:
     return text.strip()
 
 
-def format_time(iso: str) -> str:
-    dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-    now = datetime.now(timezone.utc)
+def format_time(iso: str, now: datetime | None = None) -> str:
+    try:
+        dt = datetime.fromisoformat(iso)  # accepts a trailing "Z" on 3.11+
+    except ValueError:
+        dt = datetime.fromisoformat(iso.replace("Z", "+00:00"))
+    now = now or datetime.now(timezone.utc)
     delta = now - dt
     mins = int(delta.total_seconds() / 60)
     if mins < 60:
@@ -88,8 +114,31 @@ def format_time(iso: str) -> str:
     return f"{dt.strftime('%Y-%m-%d %H:%M UTC')} ({ago})"
 
 
-def detect_financial(text: str) -> list[str]:
-    return list({m.group().upper() for m in _FIN_PATTERN.finditer(text)})
+def detect_financial(text: str) -> tuple[str, ...]:
+    lowered = text.lower()
+    if not any(lit in lowered for lit in _FIN_LITERALS):
+        return ()
+
+    if _FIN_AC is None:
+        return tuple(sorted({s.upper() for s in _FIN_PATTERN.findall(text)}))
+
+    n = len(lowered)
+    matches = []
+    for end, (order, word, bounded) in _FIN_AC.iter(lowered):
+        nxt = end + 1
+        if bounded and nxt < n and (lowered[nxt].isalnum() or lowered[nxt] == "_"):
+            continue
+        matches.append((nxt - len(word), order, nxt, word))
+
+    # Keep the regex semantics: leftmost match first, earliest keyword on
+    # ties, no overlaps.
+    found = set()
+    pos = 0
+    for start, _, stop, word in sorted(matches):
+        if start >= pos:
+            found.add(word.upper())
+            pos = stop
+    return tuple(sorted(found))
 
 
 def format_number(n: int) -> str:
@@ -104,20 +153,30 @@ def format_number(n: int) -> str:
 # Display
 # ---------------------------------------------------------------------------
 
-def print_header(count: int):
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    print(f"\n{_BOLD}{_CYAN}{'=' * 74}")
-    print(f"  TRUTH SOCIAL FEED  |  @realDonaldTrump  |  {now}")
-    print(f"  {count} posts fetched  |  curl_cffi + Chrome TLS impersonation")
-    print(f"{'=' * 74}{_RESET}\n")
-
-
-def print_post(post: dict, index: int):
+def format_header(count: int, now: datetime | None = None) -> str:
+    now = (now or datetime.now(timezone.utc)).strftime("%Y-%m-%d %H:%M UTC")
+    return (
+        f"\n{_BOLD}{_CYAN}{'=' * 74}\n"
+        f"  TRUTH SOCIAL FEED  |  @realDonaldTrump  |  {now}\n"
+        f"  {count} posts fetched  |  curl_cffi + Chrome TLS impersonation\n"
+        f"{'=' * 74}{_RESET}\n\n"
+    )
+
+
+def format_post(
+    post: dict,
+    index: int,
+    text: str | None = None,
+    keywords: tuple[str, ...] | None = None,
+    now: datetime | None = None,
+    source: dict | None = None,
+) -> str:
     is_reblog = post.get("reblog") is not None
-    source = post["reblog"] if is_reblog else post
+    if source is None:
+        source = post["reblog"] if is_reblog else post
 
-    content_html = source.get("content", "")
-    text = strip_html(content_html)
+    if text is None:
+        text = strip_html(source.get("content", ""))
     created = post.get("created_at", "")
     url = post.get("url", "")
 
@@ -125,42 +184,57 @@ def print_post(post: dict, index: int):
     reblogs = source.get("reblogs_count", 0)
     favorites = source.get("favourites_count", 0)
 
-    keywords = detect_financial(text)
+    if keywords is None:
+        keywords = detect_financial(text)
     is_financial = len(keywords) > 0
 
+    lines = []
+
     # --- separator ---
     if is_financial:
-        print(f"{_BOLD}{_RED}{'!' * 74}{_RESET}")
+        lines.append(f"{_BOLD}{_RED}{'!' * 74}{_RESET}")
     else:
-        print(f"{_DIM}{'─' * 74}{_RESET}")
+        lines.append(f"{_DIM}{'─' * 74}{_RESET}")
 
     # --- header line ---
     tag = f" {_YELLOW}[RT]{_RESET}" if is_reblog else ""
     fin_tag = f" {_BG_RED}{_WHITE}{_BOLD} FINANCIAL {_RESET}" if is_financial else ""
-    print(f"{_BOLD}{_CYAN}  #{index}{_RESET}{tag}{fin_tag}")
+    lines.append(f"{_BOLD}{_CYAN}  #{index}{_RESET}{tag}{fin_tag}")
 
     # --- time ---
-    print(f"  {_DIM}Time:{_RESET}  {format_time(created)}")
+    lines.append(f"  {_DIM}Time:{_RESET}  {format_time(created, now=now)}")
 
     # --- financial keywords ---
     if keywords:
-        kw_str = ", ".join(f"{_BOLD}{_YELLOW}{k}{_RESET}" for k in sorted(keywords))
-        print(f"  {_DIM}Tags:{_RESET}  {kw_str}")
+        kw_str = ", ".join(f"{_BOLD}{_YELLOW}{k}{_RESET}" for k in keywords)
+        lines.append(f"  {_DIM}Tags:{_RESET}  {kw_str}")
 
     # --- content ---
-    print(f"  {_DIM}{'- ' * 35}{_RESET}")
+    lines.append(f"  {_DIM}{'- ' * 35}{_RESET}")
     wrapped = textwrap.fill(text, width=70, initial_indent="  ", subsequent_indent="  ")
     if is_financial:
-        print(f"{_WHITE}{_BOLD}{wrapped}{_RESET}")
+        lines.append(f"{_WHITE}{_BOLD}{wrapped}{_RESET}")
     else:
-        print(wrapped)
+        lines.append(wrapped)
 
     # --- engagement ---
-    print(f"\n  {_GREEN}Likes {format_number(favorites)}{_RESET}"
-          f"  {_CYAN}RTs {format_number(reblogs)}{_RESET}"
-          f"  {_MAGENTA}Replies {format_number(replies)}{_RESET}"
-          f"  {_DIM}|{_RESET}  {_DIM}{url}{_RESET}")
-    print()
+    lines.append(f"\n  {_GREEN}Likes {format_number(favorites)}{_RESET}"
+                 f"  {_CYAN}RTs {format_number(reblogs)}{_RESET}"
+                 f"  {_MAGENTA}Replies {format_number(replies)}{_RESET}"
+                 f"  {_DIM}|{_RESET}  {_DIM}{url}{_RESET}")
+    lines.append("")
+
+    return "\n".join(lines) + "\n"
+
+
+def format_summary(total: int, financial_count: int) -> str:
+    return (
+        f"{_BOLD}{_CYAN}{'=' * 74}\n"
+        f"  SUMMARY: {total} posts  |  "
+        f"{_YELLOW}{financial_count} market-relevant{_CYAN}  |  "
+        f"{total - financial_count} other\n"
+        f"{'=' * 74}{_RESET}\n\n"
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -181,19 +255,23 @@ if response.status_code != 200:
     raise SystemExit(1)
 
 posts = response.json()
-print_header(len(posts))
+now = datetime.now(timezone.utc)
 
+# Each post is stripped and scanned exactly once; printing reuses the results.
+processed = []
 financial_count = 0
-for i, post in enumerate(posts, 1):
+for post in posts:
     source = post["reblog"] if post.get("reblog") else post
     text = strip_html(source.get("content", ""))
-    if detect_financial(text):
+    keywords = detect_financial(text)
+    if keywords:
         financial_count += 1
-    print_post(post, i)
-
-# --- summary ---
-print(f"{_BOLD}{_CYAN}{'=' * 74}")
-print(f"  SUMMARY: {len(posts)} posts  |  "
-      f"{_YELLOW}{financial_count} market-relevant{_CYAN}  |  "
-      f"{len(posts) - financial_count} other")
-print(f"{'=' * 74}{_RESET}\n")
+    processed.append((post, source, text, keywords))
+
+# The whole feed is rendered first and written to stdout in one call.
+out = [format_header(len(posts), now=now)]
+for i, (post, source, text, keywords) in enumerate(processed, 1):
+    out.append(format_post(post, i, text=text, keywords=keywords, now=now, source=source))
+out.append(format_summary(len(posts), financial_count))
+sys.stdout.write("".join(out))
+sys.stdout.flush()